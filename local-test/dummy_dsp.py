@@ -2,149 +2,178 @@
 Acknowledges all unknown commands, NAK for params not set, then ACK
 for params that have been set."""
 
-import select
-import socket
+import asyncio
+import logging
+import typing
 
+LOGGER = logging.getLogger(__name__)
 
-def create_dummy_dsp():
-    server = socket.socket(
-        socket.AF_INET, socket.SOCK_STREAM, socket.IPPROTO_TCP
-    )
+PORT = 48631
+
+ACK = b"ACK\r"
+PROMPT = b">\r"
+VERSION_REPLY = b"Dummy DSP\r" + PROMPT
+
+# Pending output per client, flushed once per received chunk.
+clients: dict[asyncio.StreamWriter, bytearray] = {}
+params: dict[int, int] = {}
+
+udp_transport: asyncio.DatagramTransport | None = None
+udp_clients: dict[tuple[str, int], bytearray] = {}
+
+local_ip: str = "0.0.0.0"
+
+
+def broadcast(rcn: int, val: int) -> None:
+    data = b"#%d=%d\r" % (rcn, val)
+
+    for buf in clients.values():
+        buf += data
 
-    server.bind(("", 48631))
-    server.listen(5)
+    for buf in udp_clients.values():
+        buf += data
 
-    bind = server.getsockname()
 
-    server2 = socket.socket(
-        socket.AF_INET, socket.SOCK_DGRAM, socket.IPPROTO_UDP
+def flush() -> None:
+    for client, buf in clients.items():
+        if buf:
+            client.write(bytes(buf))
+            buf.clear()
+
+    for addr, buf in udp_clients.items():
+        if buf:
+            udp_transport.sendto(bytes(buf), addr)
+            buf.clear()
+
+
+def get_param(args: list[bytes]) -> bytes:
+    return b"%d\r" % params.get(int(args[1]), -1)
+
+
+def get_param_block(args: list[bytes]) -> bytes:
+    start = int(args[1])
+    count = int(args[2])
+
+    return b"".join(
+        b"%d\r" % params.get(rcn, -1) for rcn in range(start, start + count)
     )
 
-    server2.bind(("", 48631))
-    server2_clients = set()
 
-    print(f"Listening on {bind[0]}:{bind[1]} (TCP/UDP)")
+def set_param(args: list[bytes]) -> bytes:
+    rcn = int(args[1])
+    val = int(args[2])
 
-    clients = {}
-    params = {}
+    params[rcn] = val
+
+    broadcast(rcn, val)
+
+    return ACK
 
-    try:
-        while True:
-            rc, _, _ = select.select(
-                [server, server2] + [client for client in clients], [], []
-            )
 
-            for sock in rc:
-                is_udp = False
-                addr = None
+def get_ip(args: list[bytes]) -> bytes:
+    return local_ip.encode() + b"\r"
 
-                def send(data: bytes) -> None:
-                    nonlocal is_udp, addr
 
-                    if is_udp:
-                        server2.sendto(data, addr)
-                    else:
-                        sock.send(data)
+def get_version(args: list[bytes]) -> bytes:
+    return VERSION_REPLY
 
-                if sock == server:
-                    client, addr = server.accept()
 
-                    print(f"connection from {addr[0]}:{addr[1]}")
+HANDLERS: dict[bytes, typing.Callable[[list[bytes]], bytes]] = {
+    b"GS": get_param,
+    b"GDB": get_param_block,
+    b"CS": set_param,
+    b"CSQ": set_param,
+    b"RI": get_ip,
+    b"$V": get_version,
+}
 
-                    clients[client] = addr
-                else:
-                    lines = None
 
-                    if sock == server2:
-                        is_udp = True
+def process_line(line: bytes) -> bytes:
+    LOGGER.debug("recv %r", line)
 
-                        lines, addr = server2.recvfrom(4096)
+    args = line.split(b" ", 2)
+    handler = HANDLERS.get(args[0].upper())
 
-                        client = socket.socket(
-                            socket.AF_INET,
-                            socket.SOCK_DGRAM,
-                            socket.IPPROTO_UDP
-                        )
+    if handler is None:
+        return ACK
 
-                        server2_clients.add(addr)
-                    else:
-                        lines = sock.recv(4096)
+    return handler(args)
 
-                    print(lines.decode())
 
-                    if lines == b"":
-                        if not is_udp:
-                            del clients[sock]
+async def handle(
+    reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+) -> None:
+    addr = writer.get_extra_info("peername")
 
-                        continue
+    print(f"connection from {addr[0]}:{addr[1]}")
 
-                    lines = lines.split(b"\r")[:-1]
+    clients[writer] = pending = bytearray()
+    buf = bytearray()
 
-                    for line in lines:
-                        line = line.decode()
+    try:
+        while True:
+            data = await reader.read(4096)
 
-                        if line.upper() == "$V V":
-                            print("get version")
+            if data == b"":
+                break
 
-                            send("Dummy DSP\r>\r".encode())
-                            continue
-                        else:
-                            line = line.split(" ")
+            buf += data
 
-                        line[0] = line[0].upper()
+            while (i := buf.find(b"\r")) != -1:
+                line = bytes(buf[:i])
+                del buf[: i + 1]
 
-                        match line[0]:
-                            case "GS":
-                                rcn = int(line[1])
-                                val = params[rcn] if rcn in params else -1
+                pending += process_line(line)
 
-                                print(f"get {rcn} = {val}")
+            flush()
 
-                                send(f"{val}\r".encode())
-                            case "CS":
-                                rcn = int(line[1])
-                                val = int(line[2])
+            # Only this client's errors should disconnect it.
+            await writer.drain()
+    except ConnectionError:
+        pass
+    finally:
+        del clients[writer]
 
-                                params[rcn] = val
+        writer.close()
 
-                                print(f"set {rcn} = {val}")
 
-                                for client in clients:
-                                    client.send(f"#{rcn}={val}\r".encode())
-                                
-                                for addr2 in server2_clients:
-                                    server2.sendto(f"#{rcn}={val}\r".encode(), addr2)
+class DummyDatagramProtocol(asyncio.DatagramProtocol):
+    def datagram_received(self, data: bytes, addr: tuple[str, int]) -> None:
+        pending = udp_clients.setdefault(addr, bytearray())
 
-                                send(b"ACK\r")
-                            case "CSQ":
-                                rcn = int(line[1])
-                                val = int(line[2])
+        for line in data.split(b"\r")[:-1]:
+            pending += process_line(line)
 
-                                params[rcn] = val
+        flush()
 
-                                print(f"set {rcn} = {val}")
 
-                                for client in clients:
-                                    client.send(f"#{rcn}={val}\r".encode())
-                                
-                                for addr2 in server2_clients:
-                                    server2.sendto(f"#{rcn}={val}\r".encode(), addr2)
+async def run() -> None:
+    global local_ip, udp_transport
 
-                                send(b"ACK\r")
-                            case "RI":
-                                ip = server.getsockname()[0]
+    loop = asyncio.get_running_loop()
 
-                                print(f"ip = {ip}")
+    srv = await asyncio.start_server(handle, "", PORT)
 
-                                send(f"{ip}\r".encode())
-                            case _:
-                                send(f"ACK\r".encode())
-    except KeyboardInterrupt:
-        server.close()
-        server2.close()
+    udp_transport, _ = await loop.create_datagram_endpoint(
+        DummyDatagramProtocol, local_addr=("0.0.0.0", PORT)
+    )
+
+    bind = srv.sockets[0].getsockname()
+    local_ip = bind[0]
+
+    print(f"Listening on {bind[0]}:{bind[1]} (TCP/UDP)")
+
+    try:
+        async with srv:
+            await srv.serve_forever()
+    finally:
+        udp_transport.close()
 
 
 if __name__ == "__main__":
     print("Dummy DSP v1")
 
-    create_dummy_dsp()
+    try:
+        asyncio.run(run())
+    except KeyboardInterrupt:
+        pass
@@ -3,11 +3,13 @@ import inspect
 import logging
 from math import inf
 import os
+import signal
 import sys
-from time import time
 import typing
 
-logging.basicConfig(datefmt = "%H:%M:%S", format = "%(asctime)s.%(msecs)03d [%(threadName)s][%(name)s] %(msg)s", level = logging.DEBUG)
+logging.basicConfig(datefmt = "%H:%M:%S", format = "%(asctime)s.%(msecs)03d [%(threadName)s][%(name)s] %(message)s", level = logging.DEBUG)
+
+LOGGER = logging.getLogger(__name__)
 
 curr_dir = os.path.dirname(os.path.abspath(inspect.getfile(inspect.currentframe())))
 parent_dir = os.path.dirname(curr_dir)
@@ -24,17 +26,37 @@ async def main():
     #    dsp.add_control("mute_b1t", 501, pysymnet.button_converter)
     #])
 
+    # Looked up once, rather than on every update.
+    log_info = LOGGER.info
+
     def dsp_update(control: pysymnet.DSPControl, new_val: typing.Any) -> None:
-        logging.info(f"{time()}: {control.name} = {new_val}")
+        # The record already carries a timestamp, and arguments are only
+        # formatted if the message is emitted.
+        log_info("%s = %s", control.name, new_val)
 
     dsp.subscribe(None, dsp_update)
 
     print("\r\n".join(await dsp.connection.get_version()))
     print(await dsp.connection.get_ip())
 
-    while True:
-        # await dsp.refresh_all()
+    stop = asyncio.Event()
+
+    try:
+        asyncio.get_running_loop().add_signal_handler(signal.SIGINT, stop.set)
+    except NotImplementedError:
+        # Not supported on Windows, Ctrl+C still interrupts asyncio.run.
+        pass
+
+    await stop.wait()
+
+    await dsp.connection.disconnect()
+
+# Use uvloop when it's available, see the README.
+try:
+    import uvloop
 
-        await asyncio.sleep(1)
+    uvloop.install()
+except ImportError:
+    pass
 
 asyncio.run(main())
@@ -1,15 +1,26 @@
 """SymNet connection and related."""
 
 import asyncio
+import bisect
 import collections.abc
 import enum
-import itertools
+import functools
 import logging
+import random
 import typing
+import weakref
 
 from pysymnet.exceptions import SymNetException
 
-from .const import DEFAULT_PORT, DEFAULT_TIMEOUT
+from .const import (
+    DEFAULT_PORT,
+    DEFAULT_SUBSCRIBE_GAP,
+    DEFAULT_TIMEOUT,
+    RETRY_BACKOFF,
+    RETRY_BACKOFF_MAX,
+    RETRY_JITTER,
+)
+from .converters import SymNetConverter
 from .protocol import SymNetProtocol
 from .tasks import (
     SymNetBasicTask,
@@ -32,6 +43,82 @@ class SymNetConnectionType(enum.Enum):
     UDP = "udp"
 
 
+@functools.lru_cache(maxsize=4096)
+def _gs_cmd(param: int) -> bytes:
+    return b"GS %d" % param
+
+
+@functools.lru_cache(maxsize=256)
+def _gdb_cmd(start: int, count: int) -> bytes:
+    return b"GDB %d %d" % (start, count)
+
+
+# Errors that may go away by sending the command again. Anything else,
+# such as a NAK, is raised straight away.
+_RETRIABLE_ERRORS = (TimeoutError, OSError)
+
+
+def _retry_delay(attempt: int) -> float:
+    # exponential backoff with jitter, so retries don't land together
+    backoff = min(RETRY_BACKOFF * 2 ** (attempt - 1), RETRY_BACKOFF_MAX)
+
+    return backoff + random.random() * RETRY_JITTER
+
+
+def _to_ranges(params: list[int], gap: int = 0) -> list[tuple[int, int]]:
+    # collapse sorted params into inclusive ranges in a single pass,
+    # bridging up to gap missing params between runs
+    ranges = []
+
+    if not params:
+        return ranges
+
+    start = prev = params[0]
+
+    for param in params[1:]:
+        if param - prev <= gap + 1:
+            prev = param
+        else:
+            ranges.append((start, prev))
+
+            start = prev = param
+
+    ranges.append((start, prev))
+
+    return ranges
+
+
+def _ranges_cmds(cmd: bytes, ranges: list[tuple[int, int]]) -> list[bytes]:
+    return [
+        b"%s %d" % (cmd, start)
+        if start == end
+        else b"%s %d %d" % (cmd, start, end)
+        for start, end in ranges
+    ]
+
+
+def _range_cmds(
+    cmd: bytes, params: collections.abc.Iterable[int], gap: int = 0
+) -> list[bytes]:
+    # one command per run of consecutive params
+    return _ranges_cmds(cmd, _to_ranges(sorted(params), gap))
+
+
+def _weak_callback(
+    method: typing.Callable[..., None]
+) -> typing.Callable[..., None]:
+    # Avoids the callback keeping the method's instance alive.
+    ref = weakref.WeakMethod(method)
+
+    def callback(*args) -> None:
+        target = ref()
+
+        if target is not None:
+            target(*args)
+
+    return callback
+
+
 def check_rcn(param: int):
     """Raise an exception if the RCN is not valid."""
     if param < 1 or param > 10_000:
@@ -41,18 +128,51 @@ def check_rcn(param: int):
 class SymNetConnection:
     """DSP connection interface."""
 
+    __slots__ = (
+        "_host",
+        "_port",
+        "_mode",
+        "_timeout",
+        "_subscribe_gap",
+        "_version",
+        "_version_task",
+        "_subscriptions",
+        "_subscriber_tuples",
+        "_effective_subs",
+        "_pending_subs",
+        "_pending_unsubs",
+        "_bridged",
+        "_subs_flush",
+        "_loop",
+        "_protocol_lock",
+        "_protocol",
+        "_next_connect_tasks",
+        "__weakref__",
+    )
+
     _host: str
     _port: int
     _mode: SymNetConnectionType
     _timeout: int
+    _subscribe_gap: int
 
     _version: typing.List[str]
+    _version_task: asyncio.Task[typing.List[str]] | None
 
     _subscriptions: dict[int, set[typing.Callable[[int, int], None]]]
-
+    _subscriber_tuples: dict[
+        int, tuple[typing.Callable[[int, int], None], ...]
+    ]
+    _effective_subs: dict[int, tuple[typing.Callable[[int, int], None], ...]]
+    _pending_subs: set[int]
+    _pending_unsubs: set[int]
+    _bridged: set[int]
+    _subs_flush: asyncio.Task | None
+
+    _loop: asyncio.AbstractEventLoop | None
     _protocol_lock: asyncio.Lock
     _protocol: SymNetProtocol | None
-    _next_connect_tasks: typing.List[typing.Tuple[str, SymNetTask]]
+    _next_connect_tasks: typing.List[typing.Tuple[bytes, SymNetTask]]
 
     def __init__(
         self,
@@ -60,33 +180,57 @@ class SymNetConnection:
         port: int = DEFAULT_PORT,
         mode: SymNetConnectionType = SymNetConnectionType.TCP,
         timeout: int = DEFAULT_TIMEOUT,
+        subscribe_gap_tolerance: int = DEFAULT_SUBSCRIBE_GAP,
     ):
         """Initialize the DSP connection."""
         self._host = host
         self._port = port
         self._mode = mode
         self._timeout = timeout
+        self._subscribe_gap = subscribe_gap_tolerance
 
         self._subscriptions = {}
+        self._subscriber_tuples = {}
+        self._effective_subs = {}
+        self._pending_subs = set()
+        self._pending_unsubs = set()
+        self._bridged = set()
+        self._subs_flush = None
 
         self._version = None
+        self._version_task = None
+
+        try:
+            self._loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # Not created inside a coroutine, resolved on first use.
+            self._loop = None
+
         self._protocol_lock = asyncio.Lock()
         self._protocol = None
         self._next_connect_tasks = []
 
     async def _get_connection(self) -> SymNetProtocol:
+        # Already connected, no need to wait on the lock.
+        if self._protocol is not None:
+            return self._protocol
+
         async with self._protocol_lock:
             if self._protocol is not None:
                 return self._protocol
 
-            loop = asyncio.get_running_loop()
+            loop = self.loop
 
             on_conn_made = loop.create_future()
             on_conn_lost = loop.create_future()
 
-            on_conn_lost.add_done_callback(self._conn_lost)
+            on_conn_lost.add_done_callback(_weak_callback(self._conn_lost))
 
             LOGGER.debug(f"Connection type is '{self._mode}'")
+            LOGGER.debug(
+                f"Event loop is '{type(loop).__module__}"
+                f".{type(loop).__qualname__}'"
+            )
 
             match self._mode:
                 case SymNetConnectionType.TCP:
@@ -113,7 +257,7 @@ class SymNetConnection:
                         f"'{self._mode}' is not a valid connection type."
                     )
 
-            protocol.update_callback = self._update_callback
+            protocol.update_callback = self.publish
 
             LOGGER.debug("Connecting...")
 
@@ -129,16 +273,39 @@ class SymNetConnection:
 
             self._protocol = protocol
 
+            # Restore subscriptions lost with the previous connection.
+            if self._subs_flush is None and self._pending_subs:
+                self._schedule_subscription_update().add_done_callback(
+                    self._resubscribed
+                )
+
             return protocol
 
+    def _resubscribed(self, fut: asyncio.Future[None]) -> None:
+        if not fut.cancelled() and fut.exception() is not None:
+            LOGGER.warning(
+                f"Failed to restore subscriptions: {fut.exception()}"
+            )
+
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        """Get the event loop the connection runs on."""
+        if self._loop is None:
+            self._loop = asyncio.get_running_loop()
+
+        return self._loop
+
     def _conn_lost(self, fut: asyncio.Future[Exception | None]) -> None:
         if self._protocol is not None:
             self._next_connect_tasks = self._protocol.get_queue()
 
         self._protocol = None
 
-    def _update_callback(self, rcn: int, val: int) -> None:
-        self.publish(rcn, val)
+        # The DSP forgets subscriptions with the connection, so they all
+        # need to be sent again once reconnected.
+        self._pending_subs.update(self._subscriptions)
+        self._pending_unsubs.clear()
+        self._bridged.clear()
 
     async def connect(self) -> None:
         """Connect to the DSP."""
@@ -153,15 +320,19 @@ class SymNetConnection:
 
     async def _do_task(
         self,
-        msg: str,
+        msg: bytes,
         task_factory: typing.Callable[[], SymNetTask[T]],
         retry_limit: int = 1,
     ) -> T:
         ctr: int = 0
         last_err: Exception | None = None
 
+        # Terminated once here rather than on every send.
+        payload = msg + b"\r"
+
         while ctr < retry_limit:
-            LOGGER.debug(f"'{msg}' attempt {ctr + 1} of {retry_limit}")
+            if LOGGER.isEnabledFor(logging.DEBUG):
+                LOGGER.debug(f"{msg!r} attempt {ctr + 1} of {retry_limit}")
 
             task = task_factory()
 
@@ -170,35 +341,38 @@ class SymNetConnection:
 
                 # Check if retry, if so, jump to front of queue
                 if ctr == 0:
-                    conn.queue_task(msg, task)
+                    conn.queue_task(payload, task)
                 else:
-                    conn.queue_task_immediate(msg, task)
+                    conn.queue_task_retry(payload, task)
 
-                return await asyncio.wait_for(task, self._timeout)
-            except asyncio.CancelledError:
-                # The task was cancelled, because it timed out.
-                last_err = TimeoutError()
-            except Exception as err:
+                # Cancels the task on expiry, so the queue moves on.
+                async with asyncio.timeout(self._timeout):
+                    return await task
+            except _RETRIABLE_ERRORS as err:
                 last_err = err
 
             ctr += 1
 
+            if ctr < retry_limit:
+                await asyncio.sleep(_retry_delay(ctr))
+
         if last_err is not None:
             raise last_err
 
     async def get_param(self, param: int) -> int:
         """Get value for DSP parameter."""
         return await self._do_task(
-            f"GS {param}", lambda: SymNetValueTask(), retry_limit=3
+            _gs_cmd(param), SymNetValueTask, retry_limit=3
         )
 
     async def set_param(self, param: int, value: int) -> None:
         """Set DSP parameter."""
-        await self._do_task(f"CSQ {param} {value}", lambda: SymNetBasicTask())
+        # Values rarely repeat, so this isn't worth caching like GS.
+        await self._do_task(b"CSQ %d %d" % (param, value), SymNetBasicTask)
 
     async def set_param_checked(self, param: int, value: int) -> None:
         """Set DSP parameter and ensure it exists."""
-        await self._do_task(f"CS {param} {value}", lambda: SymNetBasicTask())
+        await self._do_task(b"CS %d %d" % (param, value), SymNetBasicTask)
 
     async def change_param(self, param: int, amount: int) -> None:
         """Change DSP parameter by relative value."""
@@ -206,32 +380,65 @@ class SymNetConnection:
         amount = abs(amount)
 
         await self._do_task(
-            f"CC {param} {dir} {amount}", lambda: SymNetBasicTask()
+            b"CC %d %d %d" % (param, dir, amount), SymNetBasicTask
         )
 
     async def get_param_block(self, start: int, count: int) -> dict[int, int]:
         """Get multiple DSP parameters."""
         return await self._do_task(
-            f"GDB {start} {count}",
-            lambda: SymNetMultiValueTask(),
+            _gdb_cmd(start, count),
+            functools.partial(SymNetMultiValueTask, start, count),
             retry_limit=3,
         )
 
+    async def get_converted_block(
+        self, start: int, count: int, converter: SymNetConverter[T]
+    ) -> dict[int, T]:
+        """Get multiple DSP parameters converted with converter."""
+        vals = await self.get_param_block(start, count)
+
+        return converter.from_rcn_block(vals)
+
+    async def get_params(
+        self, params: collections.abc.Iterable[int]
+    ) -> dict[int, int]:
+        """Get multiple DSP parameters in as few requests as possible.
+
+        Consecutive parameters are read together with a single block
+        request. Parameters the DSP reports as unset are omitted.
+        """
+        ranges = _to_ranges(sorted(set(params)))
+
+        blocks = await asyncio.gather(
+            *[self._get_param_range(start, end) for start, end in ranges]
+        )
+
+        vals: dict[int, int] = {}
+
+        for block in blocks:
+            vals.update(block)
+
+        return vals
+
+    async def _get_param_range(self, start: int, end: int) -> dict[int, int]:
+        if start != end:
+            return await self.get_param_block(start, end - start + 1)
+
+        val = await self.get_param(start)
+
+        return {start: val} if val != -1 else {}
+
     async def get_preset(self) -> int:
         """Get the most recently loaded preset."""
-        return await self._do_task(
-            "GPR", lambda: SymNetValueTask(), retry_limit=3
-        )
+        return await self._do_task(b"GPR", SymNetValueTask, retry_limit=3)
 
     async def load_preset(self, preset: int) -> None:
         """Load a preset."""
-        await self._do_task(f"LP {preset}", lambda: SymNetBasicTask())
+        await self._do_task(b"LP %d" % preset, SymNetBasicTask)
 
     async def flash(self, count: int = 8) -> None:
         """Flash the lights on the DSP to identify it."""
-        await self._do_task(
-            f"FU {count}", lambda: SymNetBasicTask(), retry_limit=3
-        )
+        await self._do_task(b"FU %d" % count, SymNetBasicTask, retry_limit=3)
 
     async def set_system_string(
         self,
@@ -244,8 +451,9 @@ class SymNetConnection:
     ) -> None:
         """Set a system string on the DSP."""
         await self._do_task(
-            f"SSYSS {unit}.{resource}.{enum}.{card}.{channel}={value}",
-            lambda: SymNetBasicTask(),
+            b"SSYSS %d.%d.%d.%d.%d=%s"
+            % (unit, resource, enum, card, channel, value.encode()),
+            SymNetBasicTask,
         )
 
     async def get_system_string(
@@ -253,37 +461,50 @@ class SymNetConnection:
     ) -> str:
         """Get a system string from the DSP."""
         return await self._do_task(
-            f"GSYSS {unit}.{resource}.{enum}.{card}.{channel}",
-            lambda: SymNetStringTask(),
+            b"GSYSS %d.%d.%d.%d.%d" % (unit, resource, enum, card, channel),
+            SymNetStringTask,
             retry_limit=3,
         )
 
     async def get_ip(self) -> tuple[str, str]:
         """Get the connect IP and the self-reported DSP IP."""
-        ip = await self._do_task(
-            "RI", lambda: SymNetStringTask(), retry_limit=3
-        )
+        ip = await self._do_task(b"RI", SymNetStringTask, retry_limit=3)
 
         return (self._host, ip)
 
-    async def get_version(self) -> str:
+    async def get_version(self) -> typing.List[str]:
         """Get the version information from the DSP."""
-        if self._version is None:
-            self._version = await self._do_task(
-                "$v V", lambda: SymNetMultiStringTask(), retry_limit=3
-            )
-        else:
+        if self._version is not None:
             LOGGER.debug("Using cached version information.")
 
+            return self._version
+
+        # Concurrent callers share a single request.
+        if self._version_task is None:
+            self._version_task = asyncio.ensure_future(
+                self._do_task(b"$v V", SymNetMultiStringTask, retry_limit=3)
+            )
+
+        task = self._version_task
+
+        try:
+            self._version = await asyncio.shield(task)
+        except Exception:
+            # A late waiter mustn't drop a newer request.
+            if self._version_task is task:
+                self._version_task = None
+
+            raise
+
         return self._version
 
     async def reboot(self) -> None:
         """Reboot the DSP."""
-        await self._do_task("R!", lambda: SymNetBasicTask())
+        await self._do_task(b"R!", SymNetBasicTask)
 
     async def ping(self) -> None:
         """Ping the DSP."""
-        await self._do_task("NOP", lambda: SymNetBasicTask())
+        await self._do_task(b"NOP", SymNetBasicTask)
 
     async def subscribe(
         self,
@@ -291,23 +512,66 @@ class SymNetConnection:
         callback: typing.Callable[[int, int], None],
     ) -> None:
         """Subscribe to value changes for a parameter."""
-        try:
-            params = iter(params)
-        except TypeError:
-            params = [params]
+        await self.subscribe_nowait(params, callback)
 
-        for param in params:
-            check_rcn(param)
+    def subscribe_nowait(
+        self,
+        params: int | collections.abc.Iterable[int] | None,
+        callback: typing.Callable[[int, int], None],
+    ) -> asyncio.Future[None]:
+        """Subscribe to value changes without waiting for the DSP.
+
+        The callback is registered immediately. The returned future
+        completes once the subscription has been sent to the DSP.
+        """
+        self._add_subscriptions(params, callback)
+
+        return self._schedule_subscription_update()
+
+    async def subscribe_many(
+        self,
+        pairs: collections.abc.Iterable[
+            typing.Tuple[
+                int | collections.abc.Iterable[int] | None,
+                typing.Callable[[int, int], None],
+            ]
+        ],
+    ) -> None:
+        """Subscribe multiple callbacks with a single DSP update."""
+        for params, callback in pairs:
+            self._add_subscriptions(params, callback)
 
+        await self._schedule_subscription_update()
+
+    def _add_subscriptions(
+        self,
+        params: int | collections.abc.Iterable[int] | None,
+        callback: typing.Callable[[int, int], None],
+    ) -> None:
+        if params is None or isinstance(params, int):
+            params = (params,)
+
+        self._effective_subs.clear()
+
+        for param in params:
             if param is None:
                 param = -1
+            else:
+                check_rcn(param)
+
+            subs = self._subscriptions.get(param)
 
-            if param not in self._subscriptions:
-                self._subscriptions[param] = {callback}
+            if subs is None:
+                self._subscriptions[param] = subs = {callback}
+
+                if param in self._pending_unsubs:
+                    self._pending_unsubs.discard(param)
+                else:
+                    self._pending_subs.add(param)
             else:
-                self._subscriptions[param].add(callback)
+                subs.add(callback)
 
-        await self._update_subscriptions()
+            self._subscriber_tuples[param] = tuple(subs)
 
     async def unsubscribe(
         self,
@@ -315,96 +579,166 @@ class SymNetConnection:
         callback: typing.Callable[[int, int], None],
     ) -> None:
         """Unsubscribe from value changes for a parameter."""
-        try:
-            params = iter(params)
-        except TypeError:
-            params = [params]
+        if params is None or isinstance(params, int):
+            params = (params,)
 
-        remove_subs = []
+        self._effective_subs.clear()
 
         for param in params:
-            check_rcn(param)
-
             if param is None:
                 param = -1
+            else:
+                check_rcn(param)
 
-            if param in self._subscriptions:
-                subs = self._subscriptions[param]
+            subs = self._subscriptions.get(param)
 
+            if subs is not None:
                 subs.discard(callback)
 
                 if len(subs) == 0:
                     del self._subscriptions[param]
+                    del self._subscriber_tuples[param]
 
-                    remove_subs.append(param)
+                    if param in self._pending_subs:
+                        self._pending_subs.discard(param)
+                    else:
+                        self._pending_unsubs.add(param)
+                else:
+                    self._subscriber_tuples[param] = tuple(subs)
 
-        await self._update_subscriptions(remove_subs)
+        await self._schedule_subscription_update()
 
-    async def _update_subscriptions(
-        self, deleted_params: int | collections.abc.Iterable[int] | None = None
-    ) -> None:
-        subscribe_tasks = []
+    def _schedule_subscription_update(self) -> asyncio.Future[None]:
+        # Changes made before the update runs are sent together, so a
+        # burst of new controls results in a single batch of PUEs.
+        if self._subs_flush is None:
+            self._subs_flush = asyncio.ensure_future(
+                self._update_subscriptions()
+            )
 
-        if deleted_params is not None:
-            try:
-                deleted_params = iter(deleted_params)
-            except TypeError:
-                deleted_params = [deleted_params]
-
-            for deleted_param in deleted_params:
-                subscribe_tasks.append(
-                    self._do_task(
-                        f"PUD {deleted_param}",
-                        lambda: SymNetBasicTask(),
-                        retry_limit=3,
-                    )
-                )
+        return asyncio.shield(self._subs_flush)
 
-        # convert to ranges - https://stackoverflow.com/a/4629241
-        params = sorted(param for param in self._subscriptions)
-        ranges = []
+    async def flush_subscriptions(self) -> None:
+        """Send pending subscription changes and wait for them.
 
-        for key, group in itertools.groupby(
-            enumerate(params), lambda t: t[1] - t[0]
+        Changes that fail to send are kept, call this again to retry.
+        """
+        if self._subs_flush is not None or (
+            self._pending_subs or self._pending_unsubs
         ):
-            group = list(group)
+            await self._schedule_subscription_update()
 
-            ranges.append((group[0][1], group[-1][1]))
+    async def _update_subscriptions(self) -> None:
+        self._subs_flush = None
 
-        # subscribe
-        for start, end in ranges:
-            range_str = None
+        added = self._pending_subs
+        deleted = self._pending_unsubs
+        bridged = set(self._bridged)
 
-            if start == end:
-                range_str = f"{start}"
-            else:
-                range_str = f"{start} {end}"
+        self._pending_subs = set()
+        self._pending_unsubs = set()
 
-            subscribe_tasks.append(
-                self._do_task(
-                    f"PUE {range_str}",
-                    lambda: SymNetBasicTask(),
-                    retry_limit=3,
-                )
+        if -1 in self._subscriptions:
+            # The wildcard has the DSP push every param already.
+            msgs = [b"PUE"] if -1 in added else []
+        elif -1 in deleted:
+            # Disabling the wildcard disables every param, so re-enable
+            # the ones still subscribed to.
+            msgs = [b"PUD"]
+
+            self._bridged.clear()
+
+            msgs += self._enable_cmds(self._subscriptions)
+        else:
+            # Only send changes, collapsed into ranges. Bridging a PUD
+            # could disable a wanted param, so only bridged params that
+            # are no longer needed are added to it.
+            self._bridged -= added
+
+            unneeded = self._unneeded_bridged() if deleted else set()
+
+            msgs = _range_cmds(b"PUD", deleted | unneeded)
+            msgs += self._enable_cmds(added)
+
+        try:
+            await asyncio.gather(
+                *[
+                    self._do_task(msg, SymNetBasicTask, retry_limit=3)
+                    for msg in msgs
+                ]
             )
+        except (Exception, asyncio.CancelledError):
+            # Keep the changes for the next update, unless they have
+            # been reversed in the meantime.
+            added -= self._pending_unsubs
+            deleted -= self._pending_subs
 
-        await asyncio.gather(*subscribe_tasks)
+            self._pending_subs |= added
+            self._pending_unsubs |= deleted
 
-    def _get_subscribers(
-        self, param: int
-    ) -> typing.Generator[typing.Callable[[int, int], None], None, None]:
-        if -1 in self._subscriptions:
-            for callback in self._subscriptions[-1]:
-                yield callback
+            # Bridged params are worked out again on the retry.
+            self._bridged = bridged
+
+            raise
 
-        for callback in self._subscriptions[param]:
-            yield callback
+    def _enable_cmds(
+        self, params: collections.abc.Iterable[int]
+    ) -> list[bytes]:
+        # Gaps are bridged for PUE, updates for the extra params are
+        # ignored by publish. They are remembered so they can be
+        # disabled again once they no longer sit in a bridged gap.
+        ranges = _to_ranges(sorted(params), self._subscribe_gap)
+
+        subscriptions = self._subscriptions
+
+        for start, end in ranges:
+            self._bridged.update(
+                param
+                for param in range(start, end + 1)
+                if param not in subscriptions
+            )
+
+        return _ranges_cmds(b"PUE", ranges)
+
+    def _unneeded_bridged(self) -> set[int]:
+        # Bridged params are still useful while they lie in a gap small
+        # enough to bridge between two subscribed params.
+        subscribed = sorted(self._subscriptions)
+        unneeded = set()
+
+        for param in self._bridged:
+            idx = bisect.bisect(subscribed, param)
+
+            if (
+                idx == 0
+                or idx == len(subscribed)
+                or subscribed[idx] - subscribed[idx - 1]
+                > self._subscribe_gap + 1
+            ):
+                unneeded.add(param)
+
+        self._bridged -= unneeded
+
+        return unneeded
 
     def publish(self, param: int, value: int) -> None:
         """Trigger all callbacks that a parameter has changed."""
-        if param in self._subscriptions:
-            for callback in self._get_subscribers(param):
-                try:
-                    callback(param, value)
-                except Exception as err:
-                    LOGGER.debug(f"{param} update callback caused {err}")
+        callbacks = self._effective_subs.get(param)
+
+        if callbacks is None:
+            # Wildcard subscribers get every update, even for params
+            # nobody else is subscribed to. Cached until the next
+            # subscription change.
+            subscriber_tuples = self._subscriber_tuples
+
+            callbacks = subscriber_tuples.get(-1, ())
+            callbacks += subscriber_tuples.get(param, ())
+
+            self._effective_subs[param] = callbacks
+
+        # Called once per update line, so the loop is kept inline.
+        for callback in callbacks:
+            try:
+                callback(param, value)
+            except Exception as err:
+                LOGGER.debug(f"{param} update callback caused {err}")
@@ -4,5 +4,13 @@ DEFAULT_PORT: int = 48631
 
 DEFAULT_TIMEOUT: int = 20
 
+DEFAULT_SUBSCRIBE_GAP: int = 0
+
+RETRY_BACKOFF: float = 0.1
+RETRY_BACKOFF_MAX: float = 2.0
+RETRY_JITTER: float = 0.05
+
 DEFAULT_FADER_MIN: float = -72.0
 DEFAULT_FADER_MAX: float = 12.0
+
+DEFAULT_WRITE_DELAY: float = 0.01
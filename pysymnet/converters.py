@@ -13,6 +13,8 @@ NEGATIVE_INFINITY = float("-inf")
 class SymNetConverter(typing.Generic[T], metaclass=abc.ABCMeta):
     """Base converter for RCN values."""
 
+    __slots__ = ()
+
     @abc.abstractmethod
     def from_rcn(self, val: int) -> T:
         """Convert a DSP value to the T equivalent."""
@@ -23,13 +25,22 @@ class SymNetConverter(typing.Generic[T], metaclass=abc.ABCMeta):
         """Convert a T value to the DSP equivalent."""
         raise NotImplementedError()
 
+    def from_rcn_block(self, vals: dict[int, int]) -> dict[int, T]:
+        """Convert a block of DSP values to the T equivalents."""
+        from_rcn = self.from_rcn
+
+        return {rcn: from_rcn(val) for rcn, val in vals.items()}
+
 
 class DecibelConverter(SymNetConverter[float]):
     """DSP decibel fader value converter."""
 
+    __slots__ = ("_min", "_max", "_delta", "_scale")
+
     _min: float
     _max: float
     _delta: float
+    _scale: float
 
     def __init__(
         self, min: float = DEFAULT_FADER_MIN, max: float = DEFAULT_FADER_MAX
@@ -39,6 +50,7 @@ class DecibelConverter(SymNetConverter[float]):
         self._max = max
 
         self._delta = max - min
+        self._scale = self._delta / 65535.0
 
     @property
     def min(self) -> float:
@@ -55,28 +67,45 @@ class DecibelConverter(SymNetConverter[float]):
         if val == 0:
             return NEGATIVE_INFINITY
 
-        return self.min + self._delta * float(val) / 65535.0
+        return self._min + self._scale * val
 
     def to_rcn(self, val: float) -> int:
         """Convert a decibel value to the DSP equivalent."""
         if val == NEGATIVE_INFINITY:
             return 0
 
-        rcn_val = int((val - self.min) * 65535.0 / self._delta)
+        rcn_val = int((val - self._min) * 65535.0 / self._delta)
 
         return max(0, min(65535, rcn_val))
 
+    def from_rcn_block(self, vals: dict[int, int]) -> dict[int, float]:
+        """Convert a block of DSP values to the decibel equivalents."""
+        low = self._min
+        scale = self._scale
+
+        return {
+            rcn: low + scale * val if val != 0 else NEGATIVE_INFINITY
+            for rcn, val in vals.items()
+        }
+
 
 class PercentConverter(SymNetConverter[float]):
     """DSP percentage converter."""
 
+    __slots__ = ()
+
+    _FROM_RCN_SCALE = 100.0 / 65535.0
+    _TO_RCN_SCALE = 65535.0 / 100.0
+
     def from_rcn(self, val: int) -> float:
         """Convert a DSP value to the percentage equivalent."""
-        return val / 65535.0 * 100.0
+        return val * self._FROM_RCN_SCALE
 
     def to_rcn(self, val: float) -> int:
         """Convert a percentage value to the DSP equivalent."""
-        return val * 65535.0 / 100.0
+        rcn_val = int(val * self._TO_RCN_SCALE)
+
+        return max(0, min(65535, rcn_val))
 
 
 class ButtonConverter(SymNetConverter[bool]):
@@ -109,6 +138,8 @@ class SelectorConverter(SymNetConverter[int]):
     _options: list[str]
     _count: int
     _real_count: int
+    _to_rcn_scale: float
+    _from_rcn_scale: float
 
     def __init__(self, options: list[str], count: int | None = None):
         """Initialize enum converter."""
@@ -132,6 +163,9 @@ class SelectorConverter(SymNetConverter[int]):
                 " 2, 4, 6, 8, 12, 16"
             )
 
+        self._to_rcn_scale = 65535.0 / (self._real_count - 1)
+        self._from_rcn_scale = (self._real_count - 1) / 65535.0
+
     @property
     def count(self):
         """Get the count of values for the selector."""
@@ -145,11 +179,11 @@ class SelectorConverter(SymNetConverter[int]):
     def from_rcn(self, val: int) -> int:
         """Convert a DSP value to the selector number."""
         # TODO: RCN to selector number converter.
-        return int(val * (self._real_count - 1) / 65535.0)
+        return int(val * self._from_rcn_scale)
 
     def to_rcn(self, val: int) -> int:
         """Convert a selector value to the DSP equivalent."""
-        return int(float(val) * 65535.0 / float(self._real_count - 1))
+        return int(val * self._to_rcn_scale)
 
 
 button_converter = ButtonConverter()
@@ -0,0 +1,533 @@
+"""SymNet DSP and controls."""
+
+import asyncio
+import collections.abc
+import logging
+import typing
+
+from .connection import SymNetConnection, SymNetConnectionType
+from .const import (
+    DEFAULT_PORT,
+    DEFAULT_SUBSCRIBE_GAP,
+    DEFAULT_TIMEOUT,
+    DEFAULT_WRITE_DELAY,
+)
+from .converters import SymNetConverter
+from .exceptions import SymNetException
+
+T = typing.TypeVar("T")
+TDSPControl = typing.TypeVar("TDSPControl", bound="DSPControl")
+
+LOGGER = logging.getLogger(__name__)
+
+
+class DSPControl(typing.Generic[T]):
+    """A DSP control."""
+
+    __slots__ = (
+        "_connection",
+        "_converter",
+        "_from_rcn",
+        "_to_rcn",
+        "_name",
+        "_rcn",
+        "_curr_value",
+        "_curr_rcn",
+        "_last_set_failed",
+        "_pending_write",
+        "_subscribers",
+        "_init_event",
+        "_initialized",
+        "__weakref__",
+    )
+
+    _connection: SymNetConnection
+
+    _converter: SymNetConverter[T]
+    _from_rcn: typing.Callable[[int], T]
+    _to_rcn: typing.Callable[[T], int]
+    _name: str
+    _rcn: int
+    _curr_value: T | None
+    _curr_rcn: int | None
+    _last_set_failed: bool
+    _pending_write: asyncio.TimerHandle | None
+
+    _subscribers: tuple[typing.Callable[[TDSPControl, T, T], None], ...]
+
+    _init_event: asyncio.Event | None
+    _initialized: bool
+
+    def __init__(
+        self,
+        connection: SymNetConnection,
+        name: str,
+        rcn: int,
+        converter: SymNetConverter[T] | None,
+    ):
+        """Initialize DSP control."""
+        self._connection = connection
+        self._name = name
+        self._rcn = rcn
+        self._converter = converter
+
+        if converter is not None:
+            self._from_rcn = converter.from_rcn
+            self._to_rcn = converter.to_rcn
+        else:
+            self._from_rcn = self._to_rcn = lambda val: val
+
+        self._subscribers = ()
+
+        self._curr_value = None
+        self._curr_rcn = None
+        self._last_set_failed = False
+        self._pending_write = None
+
+        self._init_event = None
+        self._initialized = False
+
+    async def async_init(self, refresh: bool = True):
+        """Initialize subscriptions for the control.
+
+        The initial value fetch can be skipped when the caller refreshes
+        many controls together.
+        """
+        await self._wait_for_init()
+
+        if self._initialized:
+            return
+
+        self._init_event = init_event = asyncio.Event()
+
+        try:
+            subscribed = self._connection.subscribe_nowait(
+                self._rcn, self._rcn_updated
+            )
+
+            if refresh:
+                await asyncio.gather(subscribed, self.get_value())
+            else:
+                await subscribed
+
+            self._initialized = True
+        except (Exception, asyncio.CancelledError):
+            # Don't leave the update callback registered for a control
+            # that failed to initialize.
+            try:
+                await self._connection.unsubscribe(
+                    self._rcn, self._rcn_updated
+                )
+            except Exception as err:
+                LOGGER.debug(f"Failed to unsubscribe {self.name}: {err}")
+
+            raise
+        finally:
+            self._init_event = None
+
+            init_event.set()
+
+    async def _wait_for_init(self) -> None:
+        # Only allocated while an init is in progress.
+        while self._init_event is not None:
+            await self._init_event.wait()
+
+    def _rcn_updated(self, rcn: int, val: int) -> None:
+        # Only ever registered for this control's RCN.
+        old_value = self._curr_value
+
+        # The DSP reports unchanged values too, skip converting those.
+        if val != self._curr_rcn:
+            self._curr_value = self._from_rcn(val)
+            self._curr_rcn = val
+
+        value = self._curr_value
+
+        for callback in self._subscribers:
+            callback(self, value, old_value)
+
+    def _rcn_missing(self) -> None:
+        # The DSP had no value for the RCN, forget the cached one.
+        old_value = self._curr_value
+
+        self._curr_value = None
+        self._curr_rcn = None
+
+        if old_value is not None:
+            for callback in self._subscribers:
+                callback(self, None, old_value)
+
+    def subscribe(
+        self, callback: typing.Callable[[TDSPControl, T, T], None]
+    ) -> None:
+        """Register for update notifications."""
+        # Replaced rather than mutated, so updates can iterate safely.
+        if callback not in self._subscribers:
+            self._subscribers += (callback,)
+
+    def unsubscribe(
+        self, callback: typing.Callable[[TDSPControl, T, T], None]
+    ) -> None:
+        """Deregister for update notifications."""
+        self._subscribers = tuple(
+            subscriber
+            for subscriber in self._subscribers
+            if subscriber != callback
+        )
+
+    async def destroy(self) -> None:
+        """Destroy the control.
+
+        Removes all update subscribers and notifies the control that
+        we're no longer interested in it's updates.
+        """
+        await self._wait_for_init()
+
+        if not self._initialized:
+            return
+
+        self._initialized = False
+
+        if self._pending_write is not None:
+            self._pending_write.cancel()
+
+            self._pending_write = None
+
+        self._subscribers = ()
+
+        await self._connection.unsubscribe(self._rcn, self._rcn_updated)
+
+    async def get_value(self) -> T:
+        """Get the current value."""
+        val = await self._connection.get_param(self._rcn)
+
+        if val == -1:
+            self._rcn_missing()
+        else:
+            self._rcn_updated(self._rcn, val)
+
+        return self._curr_value
+
+    async def set_value(self, val: T, force: bool = False) -> None:
+        """Set the value."""
+        old_value = self._curr_value
+        old_rcn = self._curr_rcn
+        rcn_val = self._to_rcn(val)
+
+        if not force and not self._last_set_failed:
+            # Values that convert to the same RCN value are no change.
+            if val == old_value or rcn_val == old_rcn:
+                return
+
+        self._curr_value = val
+        self._curr_rcn = rcn_val
+
+        try:
+            await self._connection.set_param(self._rcn, rcn_val)
+        except Exception as err:
+            try:
+                # Try to determine if the call actually succeeded.
+                curr_value = await self.get_value()
+
+                if val == curr_value:
+                    self._last_set_failed = False
+
+                    return
+            except SymNetException:
+                self._curr_value = old_value
+                self._curr_rcn = old_rcn
+                self._last_set_failed = True
+
+                LOGGER.warning(
+                    (
+                        f"Failed to verify that {self.name} was set. Restoring"
+                        f" previous value {old_value} for future checks."
+                    )
+                )
+
+            raise err
+
+        self._last_set_failed = False
+
+    @property
+    def value(self) -> T:
+        """Get the current value."""
+        return self._curr_value
+
+    @value.setter
+    def value(self, val: T) -> None:
+        """Set the value.
+
+        Assignments made in quick succession are coalesced, and only the
+        last value is sent to the DSP.
+        """
+        if self._pending_write is not None:
+            self._pending_write.cancel()
+
+        self._pending_write = self._connection.loop.call_later(
+            DEFAULT_WRITE_DELAY, self._flush_write, val
+        )
+
+    def _flush_write(self, val: T) -> None:
+        self._pending_write = None
+
+        fut = asyncio.ensure_future(self.set_value(val))
+        fut.add_done_callback(self._write_done)
+
+    def _write_done(self, fut: asyncio.Future[None]) -> None:
+        if not fut.cancelled() and fut.exception() is not None:
+            LOGGER.warning(f"Failed to set {self.name}: {fut.exception()}")
+
+    @property
+    def control_number(self) -> int:
+        """Get the control number."""
+        return self._rcn
+
+    @property
+    def name(self) -> str:
+        """Get the name of the control."""
+        return self._name
+
+
+class DSP:
+    """A SymNet compatible DSP."""
+
+    __slots__ = (
+        "_host",
+        "_port",
+        "_mode",
+        "_timeout",
+        "_connection",
+        "_controls",
+        "_subscriptions",
+        "__weakref__",
+    )
+
+    _SLOTS = frozenset(__slots__)
+
+    _host: str
+    _port: int
+    _mode: SymNetConnectionType
+    _timeout: int
+
+    _connection: SymNetConnection
+
+    _controls: dict[str, DSPControl]
+    _subscriptions: set[DSPControl]
+
+    def __init__(
+        self,
+        host: str,
+        port: int = DEFAULT_PORT,
+        mode: SymNetConnectionType = SymNetConnectionType.TCP,
+        timeout: int = DEFAULT_TIMEOUT,
+        subscribe_gap_tolerance: int = DEFAULT_SUBSCRIBE_GAP,
+    ):
+        """Initialize DSP host."""
+        self._host = host
+        self._port = port
+        self._mode = mode
+        self._timeout = timeout
+
+        self._controls = {}
+        self._subscriptions = set()
+
+        self._connection = SymNetConnection(
+            host, port, mode, timeout, subscribe_gap_tolerance
+        )
+
+    async def add_control(
+        self, name: str, rcn: int, converter: SymNetConverter[T] | None = None
+    ) -> DSPControl:
+        """Add a control property for the DSP."""
+        if name in self._controls:
+            return self._controls[name]
+
+        control = DSPControl(self._connection, name, rcn, converter)
+
+        await control.async_init()
+
+        self._controls[name] = control
+
+        control.subscribe(self._control_updated)
+
+        return control
+
+    async def add_controls(
+        self,
+        specs: collections.abc.Iterable[
+            typing.Tuple[str, int, SymNetConverter | None]
+        ],
+    ) -> typing.List[DSPControl]:
+        """Add multiple control properties for the DSP at once."""
+        specs = list(specs)
+        new_controls: dict[str, DSPControl] = {}
+
+        for name, rcn, converter in specs:
+            if name not in self._controls and name not in new_controls:
+                new_controls[name] = DSPControl(
+                    self._connection, name, rcn, converter
+                )
+
+        try:
+            # Subscriptions made together are sent in one batch.
+            await asyncio.gather(
+                *[
+                    control.async_init(refresh=False)
+                    for control in new_controls.values()
+                ]
+            )
+
+            await self._refresh(new_controls.values())
+        except (Exception, asyncio.CancelledError):
+            # The controls were never added, so don't leave their
+            # subscriptions behind.
+            await asyncio.gather(
+                *[control.destroy() for control in new_controls.values()],
+                return_exceptions=True,
+            )
+
+            raise
+
+        for name, control in new_controls.items():
+            self._controls[name] = control
+
+            control.subscribe(self._control_updated)
+
+        return [self._controls[name] for name, _, _ in specs]
+
+    async def remove_control(self, nameOrControl: str | DSPControl) -> None:
+        """Remove a control property for the DSP."""
+        # Ensure it's a control
+        nameOrControl = self.get_control(nameOrControl)
+
+        nameOrControl.unsubscribe(self._control_updated)
+
+        await nameOrControl.destroy()
+
+        del self._controls[nameOrControl.name]
+
+    def get_control(self, nameOrControl: str | DSPControl[T]) -> DSPControl[T]:
+        """Get a DSP control."""
+        if not isinstance(nameOrControl, DSPControl):
+            nameOrControl = self._controls[nameOrControl]
+
+        return nameOrControl
+
+    def __getattr__(self, name: str) -> typing.Any:
+        """Get DSP control value, or pass up the chain."""
+        # Unset slots also end up here, so don't look them up again.
+        if name not in self._SLOTS:
+            control = self._controls.get(name)
+
+            if control is not None:
+                return control.value
+
+        raise AttributeError(
+            f"'{type(self).__name__}' object has no attribute '{name}'"
+        )
+
+    def __setattr__(self, name: str, value: T) -> None:
+        """Set a DSP control value, or pass up the chain."""
+        if name not in self._SLOTS:
+            control = self._controls.get(name)
+
+            if control is not None:
+                control.value = value
+
+                return
+
+        object.__setattr__(self, name, value)
+
+    def __delattr__(self, name: str) -> None:
+        """Delete a DSP control, or pass up the chain.
+
+        The control is destroyed in the background, use remove_control
+        to wait for it.
+        """
+        if name not in self._SLOTS and name in self._controls:
+            asyncio.ensure_future(self._controls.pop(name).destroy())
+        else:
+            object.__delattr__(self, name)
+
+    async def refresh_all(self) -> None:
+        """Refresh all DSP controls."""
+        await self._refresh(self._controls.values())
+
+    async def _refresh(
+        self, controls: collections.abc.Collection[DSPControl]
+    ) -> None:
+        vals = await self._connection.get_params(
+            control._rcn for control in controls
+        )
+
+        for control in controls:
+            rcn = control._rcn
+            val = vals.get(rcn)
+
+            if val is None:
+                control._rcn_missing()
+            else:
+                control._rcn_updated(rcn, val)
+
+    async def get_param_block(
+        self,
+        start: int,
+        count: int,
+        converter: SymNetConverter[T] | None = None,
+    ) -> dict[int, T]:
+        """Get multiple DSP parameters, optionally converted."""
+        vals = await self._connection.get_param_block(start, count)
+
+        if converter is None:
+            return vals
+
+        return converter.from_rcn_block(vals)
+
+    async def connect(self) -> None:
+        """Connect to the DSP."""
+        await self._connection.connect()
+        await self._connection.flush_subscriptions()
+
+    def _control_updated(
+        self, control: DSPControl[T], val: T, old_val: T
+    ) -> None:
+        for callback in self._subscriptions:
+            callback(control, val)
+
+    def subscribe(
+        self,
+        nameOrControl: str | DSPControl[T] | None,
+        callback: typing.Callable[[DSPControl[T], T, T], None],
+    ) -> None:
+        """Subscribe to a control update."""
+        if nameOrControl is None:
+            self._subscriptions.add(callback)
+
+            return
+
+        if not isinstance(nameOrControl, DSPControl):
+            nameOrControl = self._controls[nameOrControl]
+
+        nameOrControl.subscribe(callback)
+
+    def unsubscribe(
+        self,
+        nameOrControl: str | DSPControl[T] | None,
+        callback: typing.Callable[[DSPControl[T], T, T], None],
+    ) -> None:
+        """Unsubscribe to a control update."""
+        if nameOrControl is None:
+            self._subscriptions.discard(callback)
+
+            return
+
+        if not isinstance(nameOrControl, DSPControl):
+            nameOrControl = self._controls[nameOrControl]
+
+        nameOrControl.unsubscribe(callback)
+
+    @property
+    def connection(self) -> SymNetConnection:
+        """Get the SymNet connection."""
+        return self._connection
@@ -18,10 +18,14 @@ class SymNetProtocol(asyncio.Protocol, asyncio.DatagramProtocol):
     _on_conn_lost: asyncio.Future[Exception] | None
     _transport: asyncio.Transport | asyncio.DatagramTransport
     _is_datagram: bool
+    _rx_buf: bytes
+    _write: typing.Callable[[bytes], None]
 
-    _current_msg: str | None
+    _current_msg: bytes | None
     _current_task: SymNetTask | None
-    _queue: collections.deque[typing.Tuple[str, SymNetTask]]
+    _msg_queue: collections.deque[bytes]
+    _task_queue: collections.deque[SymNetTask]
+    _retry_queue: collections.deque[typing.Tuple[bytes, SymNetTask]]
 
     update_callback: typing.Callable[[int, int], None] | None
 
@@ -38,10 +42,14 @@ class SymNetProtocol(asyncio.Protocol, asyncio.DatagramProtocol):
         self._transport = None
 
         self._is_datagram = is_datagram
+        self._rx_buf = b""
 
         self._current_msg = None
         self._current_task = None
-        self._queue = collections.deque()
+        # Kept in lockstep, avoiding a tuple per queued command.
+        self._msg_queue = collections.deque()
+        self._task_queue = collections.deque()
+        self._retry_queue = collections.deque()
 
         self.update_callback = None
 
@@ -53,117 +61,207 @@ class SymNetProtocol(asyncio.Protocol, asyncio.DatagramProtocol):
 
         self._transport = transport
 
+        # Resolve the send method once rather than on every command.
+        if self._is_datagram:
+            self._write = transport.sendto
+        else:
+            self._write = transport.write
+
         if self._on_conn_made is not None:
             self._on_conn_made.set_result(True)
 
-    def _process_line(self, line: str) -> None:
-        LOGGER.debug(f"Processing line '{line}'")
+    def _process_line(self, line: bytes) -> None:
+        # Hot path, only format the message when it will be logged.
+        if LOGGER.isEnabledFor(logging.DEBUG):
+            LOGGER.debug(f"Processing line {line!r}")
 
-        if line == "":
+        if not line:
             return
 
         task = self._current_task
 
-        if (task is None or not task.expects_update_format) and line[0] == "#":
-            pos = line.index("=")
-            after_equal = pos + 1
+        # Check the line before the task, so command replies skip the
+        # task attribute lookup.
+        if line[:1] == b"#" and (
+            task is None or not task.expects_update_format
+        ):
+            rcn, sep, val = line[1:].partition(b"=")
+
+            if sep:
+                try:
+                    rcn, val = int(rcn), int(val)
+                except ValueError:
+                    pass
+                else:
+                    if self.update_callback is not None:
+                        self.update_callback(rcn, val)
 
-            rcn = int(line[1:pos])
-            val = int(line[after_equal:])
+                    return
 
-            if val == -1:
-                pass  # should never happen
+        if task is None:
+            LOGGER.debug(f"Unexpected data from DSP {line!r}.")
+
+            return
 
-            if self.update_callback is not None:
-                self.update_callback(rcn, val)
-        elif task is not None:
-            if line.upper() == "NAK":
+        # A task completed elsewhere, such as by a timeout, has nothing
+        # left to receive the reply.
+        if not task.done():
+            # The DSP always replies in upper case.
+            if line == b"NAK":
                 task.set_exception(SymNetException("NAK received from DSP."))
             else:
                 task.handle_line(line)
-        else:
-            LOGGER.debug("Unexpected data from DSP '{line}'.")
+
+        # Send the next command now, rather than on the next loop
+        # iteration when the done callback runs.
+        if task.done():
+            self._task_finished(task)
+
+    def _send_task(self, msg: bytes, task: SymNetTask) -> None:
+        self._current_msg = msg
+        self._current_task = task
+
+        # Replies complete the task in _process_line, this only covers
+        # tasks cancelled while waiting on the DSP.
+        task.cancel_callback = self._task_finished
+
+        if LOGGER.isEnabledFor(logging.DEBUG):
+            LOGGER.debug(f"Sending {msg!r}.")
+
+        self._write(msg)
 
     def _try_process_tasks(self) -> None:
         if self._current_task is not None:
             return
 
-        try:
-            msg: str
-            task: SymNetTask
+        # Retries go before everything else, oldest first.
+        while self._retry_queue:
+            msg, task = self._retry_queue.popleft()
 
-            msg, task = self._queue.popleft()
+            if not task.cancelled():
+                self._send_task(msg, task)
 
-            while task.cancelled():
-                msg, task = self._queue.popleft()
+                return
 
-            self._current_msg = msg
-            self._current_task = task
+        try:
+            msg: bytes
+            task: SymNetTask
 
-            task.add_done_callback(self._task_done)
+            msg = self._msg_queue.popleft()
+            task = self._task_queue.popleft()
 
-            LOGGER.debug(f"Sending '{msg}'.")
+            while task.cancelled():
+                msg = self._msg_queue.popleft()
+                task = self._task_queue.popleft()
 
-            self._write(msg + "\r")
+            self._send_task(msg, task)
         except IndexError:
             pass
 
-    def _task_done(self, fut: asyncio.Future) -> None:
-        try:
-            result = fut.result()
+    def _task_finished(self, task: SymNetTask) -> None:
+        # Tasks requeued after a reconnect may be cancelled later.
+        if task is not self._current_task:
+            return
 
-            LOGGER.debug(f"Task completed with result {result}")
-        except (Exception, asyncio.CancelledError) as err:
-            LOGGER.debug(f"Task completed with exception {err}")
+        if LOGGER.isEnabledFor(logging.DEBUG):
+            try:
+                result = task.result()
+
+                LOGGER.debug(f"Task completed with result {result}")
+            except (Exception, asyncio.CancelledError) as err:
+                LOGGER.debug(f"Task completed with exception {err}")
 
         self._current_task = None
 
         self._try_process_tasks()
 
-    def queue_task(self, msg: str, task: SymNetTask) -> None:
-        """Add a task to the end of the queue."""
-        LOGGER.debug(f"Queued '{msg}'.")
+    def queue_task(self, msg: bytes, task: SymNetTask) -> None:
+        """Add a task to the end of the queue.
+
+        The message must include its terminating carriage return.
+        """
+        if LOGGER.isEnabledFor(logging.DEBUG):
+            LOGGER.debug(f"Queued {msg!r}.")
+
+        # Nothing in flight or waiting, so skip the round trip through
+        # the queue. Cancelled tasks must never be sent.
+        if (
+            self._current_task is None
+            and not self._task_queue
+            and not self._retry_queue
+            and not task.cancelled()
+        ):
+            self._send_task(msg, task)
+
+            return
 
-        self._queue.append((msg, task))
+        self._msg_queue.append(msg)
+        self._task_queue.append(task)
 
         self._try_process_tasks()
 
-    def queue_task_immediate(self, msg: str, task: SymNetTask) -> None:
+    def queue_task_immediate(self, msg: bytes, task: SymNetTask) -> None:
         """Add a task to the front of the queue."""
-        LOGGER.debug(f"Queued immediate '{msg}'.")
+        if LOGGER.isEnabledFor(logging.DEBUG):
+            LOGGER.debug(f"Queued immediate {msg!r}.")
 
-        self._queue.appendleft((msg, task))
+        self._msg_queue.appendleft(msg)
+        self._task_queue.appendleft(task)
 
         self._try_process_tasks()
 
-    def get_queue(self) -> typing.List[typing.Tuple[str, SymNetTask]]:
+    def queue_task_retry(self, msg: bytes, task: SymNetTask) -> None:
+        """Add a retried task ahead of all other queued tasks."""
+        if LOGGER.isEnabledFor(logging.DEBUG):
+            LOGGER.debug(f"Queued retry {msg!r}.")
+
+        self._retry_queue.append((msg, task))
+
+        self._try_process_tasks()
+
+    def get_queue(self) -> typing.List[typing.Tuple[bytes, SymNetTask]]:
         """Get all tasks in the queue."""
-        tasks = list(self._queue)
+        tasks = []
 
         if self._current_task is not None and not self._current_task.done():
-            tasks = [(self._current_msg, self._current_task)] + tasks
+            tasks.append((self._current_msg, self._current_task))
 
             self._current_msg = None
             self._current_task = None
 
+        # Built in place, rather than copying the list to prepend.
+        tasks += self._retry_queue
+        tasks += zip(self._msg_queue, self._task_queue)
+
         return tasks
 
     def data_received(self, data: bytes) -> None:
         """Notify that TCP data has been received."""
-        for line in data.decode().splitlines():
+        # A line may be split across reads, keep the unterminated tail.
+        # Only the new data is searched, so a long line arriving in
+        # many small reads isn't rescanned on every read.
+        if b"\r" not in data:
+            self._rx_buf += data
+
+            return
+
+        # Usually there is no tail, so skip copying the data onto it.
+        if self._rx_buf:
+            data = self._rx_buf + data
+
+        lines = data.split(b"\r")
+
+        self._rx_buf = lines.pop()
+
+        for line in lines:
             self._process_line(line.strip())
 
     def datagram_received(
         self, data: bytes, addr: typing.Tuple[str, int]
     ) -> None:
         """Notify that UDP data has been received."""
-        self.data_received(data)
-
-    def _write(self, data: str) -> None:
-        if self.is_datagram:
-            self._transport.sendto(data.encode())
-        else:
-            self._transport.write(data.encode())
+        for line in data.split(b"\r"):
+            self._process_line(line.strip())
 
     def connection_lost(self, err: Exception | None) -> None:
         """Notify that the connection has been disconnected."""
@@ -12,48 +12,74 @@ T = typing.TypeVar("T")
 class SymNetTask(typing.Generic[T], asyncio.Future[T], metaclass=abc.ABCMeta):
     """Base SymNet task."""
 
+    __slots__ = ("cancel_callback",)
+
     expects_update_format: bool = False
 
+    cancel_callback: typing.Callable[["SymNetTask"], None] | None
+
     def __init__(self):
         """Initialize task."""
         super().__init__()
 
+        self.cancel_callback = None
+
+    def cancel(self, msg: typing.Any | None = None) -> bool:
+        """Cancel the task and notify the cancel callback."""
+        if not super().cancel(msg):
+            return False
+
+        # Called directly, rather than as a done callback scheduled on
+        # the next loop iteration.
+        if self.cancel_callback is not None:
+            self.cancel_callback(self)
+
+        return True
+
     @abc.abstractmethod
-    def handle_line(self, line: str) -> None:
-        """Process a line of text returned from the DSP."""
+    def handle_line(self, line: bytes) -> None:
+        """Process a line returned from the DSP."""
         raise NotImplementedError()
 
 
 class SymNetBasicTask(SymNetTask[bool]):
     """SymNet task that returns ACK/NAK."""
 
+    __slots__ = ()
+
     def __init__(self):
         """Initialize task."""
         super().__init__()
 
-    def handle_line(self, line: str) -> None:
-        """Process a line of text returned from the DSP."""
-        if line.upper() == "ACK":
+    def handle_line(self, line: bytes) -> None:
+        """Process a line returned from the DSP."""
+        if line == b"ACK":
             self.set_result(True)
         else:
-            self.set_exception(SymNetException(f"Unexpected value: '{line}'"))
+            self.set_exception(
+                SymNetException(f"Unexpected value: '{line.decode()}'")
+            )
 
 
 class SymNetStringTask(SymNetTask[str]):
     """SymNet task that returns a single string."""
 
+    __slots__ = ()
+
     def __init__(self):
         """Initialize task."""
         super().__init__()
 
-    def handle_line(self, line: str) -> None:
-        """Process a line of text returned from the DSP."""
-        self.set_result(line)
+    def handle_line(self, line: bytes) -> None:
+        """Process a line returned from the DSP."""
+        self.set_result(line.decode())
 
 
 class SymNetMultiStringTask(SymNetTask[typing.List[str]]):
     """SymNet task that returns multiple strings."""
 
+    __slots__ = ("_strs",)
+
     _strs: typing.List[str]
 
     def __init__(self):
@@ -62,39 +88,42 @@ class SymNetMultiStringTask(SymNetTask[typing.List[str]]):
 
         self._strs = []
 
-    def handle_line(self, line: str) -> None:
-        """Process a line of text returned from the DSP."""
-        if line == ">":
+    def handle_line(self, line: bytes) -> None:
+        """Process a line returned from the DSP."""
+        if line == b">":
             self.set_result(self._strs)
         else:
-            self._strs.append(line)
+            self._strs.append(line.decode())
 
 
 class SymNetValueTask(SymNetTask[int]):
     """SymNet task that returns an integer."""
 
+    __slots__ = ()
+
     def __init__(self):
         """Initialize task."""
         super().__init__()
 
-    def handle_line(self, line: str) -> None:
-        """Process a line of text returned from the DSP."""
+    def handle_line(self, line: bytes) -> None:
+        """Process a line returned from the DSP."""
         try:
             val: int = int(line)
-
+        except ValueError as err:
+            self.set_exception(err)
+        else:
             self.set_result(val)
-        except Exception as err:
-            self.error(err)
 
 
 class SymNetMultiValueTask(SymNetTask[dict[int, int]]):
     """SymNet task that returns multiple integers."""
 
+    __slots__ = ("start_control", "control_count", "_values")
+
     start_control: int
     control_count: int
 
-    _values: dict[int, int]
-    _line_counter: int
+    _values: typing.List[int]
 
     def __init__(
         self,
@@ -107,23 +136,27 @@ class SymNetMultiValueTask(SymNetTask[dict[int, int]]):
         self.start_control = start_control
         self.control_count = control_count
 
-        self._values = {}
-        self._line_counter = 0
+        # Replies arrive in order, so keyed only once complete.
+        self._values = []
 
-    def handle_line(self, line: str) -> None:
-        """Process a line of text returned from the DSP."""
+    def handle_line(self, line: bytes) -> None:
+        """Process a line returned from the DSP."""
         try:
             val: int = int(line)
-            control: int = self.start_control + self._line_counter
+        except ValueError as err:
+            self.set_exception(err)
 
-            self._line_counter += 1
+            return
 
-            if val == -1:
-                return
+        values = self._values
 
-            self._values[control] = val
+        values.append(val)
 
-            if self._line_counter == self.control_count:
-                self.set_result(self._values)
-        except Exception as err:
-            self.error(err)
+        if len(values) == self.control_count:
+            self.set_result(
+                {
+                    control: value
+                    for control, value in enumerate(values, self.start_control)
+                    if value != -1
+                }
+            )
@@ -0,0 +1,320 @@
+import asyncio
+import unittest
+import unittest.mock
+
+from pysymnet.connection import SymNetConnection, _range_cmds, _to_ranges
+from pysymnet.exceptions import SymNetException
+
+
+class TestSubscriptionRanges(unittest.TestCase):
+    def test_to_ranges(self):
+        print("Testing empty params produce no ranges")
+
+        self.assertEqual(_to_ranges([]), [])
+
+        print("Testing single param is a range of one")
+
+        self.assertEqual(_to_ranges([5]), [(5, 5)])
+
+        print("Testing consecutive params are collapsed")
+
+        self.assertEqual(
+            _to_ranges([1, 2, 3, 5, 7, 8, 10]),
+            [(1, 3), (5, 5), (7, 8), (10, 10)],
+        )
+
+        print("Testing small gaps are bridged")
+
+        self.assertEqual(
+            _to_ranges([1, 2, 5, 7, 10], gap=1), [(1, 2), (5, 7), (10, 10)]
+        )
+
+    def test_range_cmds(self):
+        print("Testing unsorted params produce one command per range")
+
+        self.assertEqual(
+            _range_cmds(b"PUE", {10, 2, 1, 3, 7}),
+            [b"PUE 1 3", b"PUE 7", b"PUE 10"],
+        )
+
+        print("Testing no params produce no commands")
+
+        self.assertEqual(_range_cmds(b"PUD", set()), [])
+
+
+class TestSubscriptions(unittest.IsolatedAsyncioTestCase):
+    async def test_subscribe_many(self):
+        sent = []
+
+        async def do_task(conn, msg, *args, **kwargs):
+            sent.append(msg)
+
+        conn = SymNetConnection("localhost")
+
+        print("Testing subscriptions are sent in a single batch")
+
+        with unittest.mock.patch.object(SymNetConnection, "_do_task", do_task):
+            await conn.subscribe_many(
+                [(1, print), (2, print), ([3, 4], print), (10, print)]
+            )
+
+        self.assertEqual(sent, [b"PUE 1 4", b"PUE 10"])
+
+        sent.clear()
+
+        print("Testing gaps aren't bridged by default")
+
+        with unittest.mock.patch.object(SymNetConnection, "_do_task", do_task):
+            await conn.subscribe_many([(14, print), (16, print)])
+
+        self.assertEqual(sent, [b"PUE 14", b"PUE 16"])
+
+        sent.clear()
+
+        print("Testing gaps up to the tolerance are bridged")
+
+        conn = SymNetConnection("localhost", subscribe_gap_tolerance=4)
+
+        with unittest.mock.patch.object(SymNetConnection, "_do_task", do_task):
+            await conn.subscribe_many([(14, print), (18, print), (30, print)])
+
+        self.assertEqual(sent, [b"PUE 14 18", b"PUE 30"])
+
+    async def test_unsubscribe(self):
+        sent = []
+
+        async def do_task(conn, msg, *args, **kwargs):
+            sent.append(msg)
+
+        conn = SymNetConnection("localhost")
+
+        with unittest.mock.patch.object(SymNetConnection, "_do_task", do_task):
+            await conn.subscribe([1, 2, 3, 4], print)
+
+            sent.clear()
+
+            print("Testing unsubscriptions are sent as ranges")
+
+            await asyncio.gather(
+                conn.unsubscribe([2, 3], print), conn.unsubscribe(4, print)
+            )
+
+            self.assertEqual(sent, [b"PUD 2 4"])
+
+            sent.clear()
+
+            print("Testing an unsubscribe cancelled by a subscribe is dropped")
+
+            await asyncio.gather(
+                conn.unsubscribe(1, print), conn.subscribe(1, print)
+            )
+
+            self.assertEqual(sent, [])
+
+    async def test_unsubscribe_bridged(self):
+        sent = []
+
+        async def do_task(conn, msg, *args, **kwargs):
+            sent.append(msg)
+
+        conn = SymNetConnection("localhost", subscribe_gap_tolerance=4)
+
+        with unittest.mock.patch.object(SymNetConnection, "_do_task", do_task):
+            await conn.subscribe([14, 18], print)
+
+            self.assertEqual(sent, [b"PUE 14 18"])
+
+            sent.clear()
+
+            print("Testing bridged params are disabled with their gap")
+
+            await conn.unsubscribe(18, print)
+
+            self.assertEqual(sent, [b"PUD 15 18"])
+
+            sent.clear()
+
+            await conn.unsubscribe(14, print)
+
+            self.assertEqual(sent, [b"PUD 14"])
+
+            sent.clear()
+
+            print("Testing bridged params are disabled with the range")
+
+            await conn.subscribe([14, 18], print)
+            await conn.unsubscribe([14, 18], print)
+
+            self.assertEqual(sent, [b"PUE 14 18", b"PUD 14 18"])
+
+    async def test_failed_update(self):
+        sent = []
+        failures = [TimeoutError()]
+
+        async def do_task(conn, msg, *args, **kwargs):
+            sent.append(msg)
+
+            if failures:
+                raise failures.pop()
+
+        conn = SymNetConnection("localhost")
+
+        print("Testing a failed subscription is sent again")
+
+        with unittest.mock.patch.object(SymNetConnection, "_do_task", do_task):
+            with self.assertRaises(TimeoutError):
+                await conn.subscribe(10, print)
+
+            sent.clear()
+
+            await conn.subscribe(50, print)
+
+        self.assertEqual(sent, [b"PUE 10", b"PUE 50"])
+
+        sent.clear()
+
+        print("Testing a failed bridged unsubscribe is retried by a flush")
+
+        conn = SymNetConnection("localhost", subscribe_gap_tolerance=4)
+
+        with unittest.mock.patch.object(SymNetConnection, "_do_task", do_task):
+            await conn.subscribe([14, 18], print)
+
+            failures.append(TimeoutError())
+
+            with self.assertRaises(TimeoutError):
+                await conn.unsubscribe(18, print)
+
+            sent.clear()
+
+            await conn.flush_subscriptions()
+
+        self.assertEqual(sent, [b"PUD 15 18"])
+
+    async def test_wildcard(self):
+        sent = []
+
+        async def do_task(conn, msg, *args, **kwargs):
+            sent.append(msg)
+
+        conn = SymNetConnection("localhost")
+
+        with unittest.mock.patch.object(SymNetConnection, "_do_task", do_task):
+            await conn.subscribe([1, 2], print)
+
+            sent.clear()
+
+            print("Testing the wildcard enables every param")
+
+            await conn.subscribe(None, print)
+            await conn.subscribe(5, print)
+
+            self.assertEqual(sent, [b"PUE"])
+
+            sent.clear()
+
+            print("Testing removing the wildcard re-enables the rest")
+
+            await conn.unsubscribe(None, print)
+
+            self.assertEqual(sent, [b"PUD", b"PUE 1 2", b"PUE 5"])
+
+        print("Testing invalid params are rejected")
+
+        with self.assertRaises(SymNetException):
+            conn.subscribe_nowait(0, print)
+
+
+class TestGetParams(unittest.IsolatedAsyncioTestCase):
+    async def test_get_params(self):
+        sent = []
+
+        async def do_task(conn, msg, task_factory, *args, **kwargs):
+            sent.append(msg)
+
+            if msg.startswith(b"GDB"):
+                task = task_factory()
+
+                for val in (1, -1, 3):
+                    task.handle_line(b"%d" % val)
+
+                return task.result()
+
+            return 10
+
+        conn = SymNetConnection("localhost")
+
+        print("Testing consecutive params are read as a block")
+
+        with unittest.mock.patch.object(SymNetConnection, "_do_task", do_task):
+            vals = await conn.get_params([3, 1, 2, 10, 2])
+
+        self.assertEqual(sent, [b"GDB 1 3", b"GS 10"])
+        self.assertEqual(vals, {1: 1, 3: 3, 10: 10})
+
+
+class TestRetries(unittest.IsolatedAsyncioTestCase):
+    async def _attempts(self, err):
+        attempts = []
+
+        class Protocol:
+            def queue_task(self, msg, task):
+                attempts.append(msg)
+
+                task.set_exception(err)
+
+            queue_task_retry = queue_task
+
+        async def get_connection(conn):
+            return Protocol()
+
+        conn = SymNetConnection("localhost")
+
+        with unittest.mock.patch.object(
+            SymNetConnection, "_get_connection", get_connection
+        ):
+            with self.assertRaises(type(err)):
+                await conn.get_param(1)
+
+        return attempts
+
+    async def test_retries(self):
+        print("Testing timeouts are retried")
+
+        self.assertEqual(len(await self._attempts(TimeoutError())), 3)
+
+        print("Testing NAKs are not retried")
+
+        self.assertEqual(len(await self._attempts(SymNetException("NAK"))), 1)
+
+
+class TestPublish(unittest.IsolatedAsyncioTestCase):
+    async def test_publish(self):
+        updates = []
+
+        async def do_task(conn, msg, *args, **kwargs):
+            pass
+
+        conn = SymNetConnection("localhost")
+
+        with unittest.mock.patch.object(SymNetConnection, "_do_task", do_task):
+            await conn.subscribe(None, lambda *args: updates.append(args))
+
+        print("Testing wildcard subscribers get unsubscribed params")
+
+        conn.publish(5, 100)
+
+        self.assertEqual(updates, [(5, 100)])
+
+        print("Testing a new subscriber is used after being cached")
+
+        with unittest.mock.patch.object(SymNetConnection, "_do_task", do_task):
+            await conn.subscribe(5, lambda *args: updates.append(args))
+
+        conn.publish(5, 200)
+
+        self.assertEqual(updates, [(5, 100), (5, 200), (5, 200)])
+
+
+if __name__ == "__main__":
+    unittest.main()
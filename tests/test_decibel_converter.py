@@ -7,44 +7,35 @@ from pysymnet import DecibelConverter
 class TestDecibelConverter(unittest.TestCase):
     converter = DecibelConverter()
 
-    def test_from_rcn(self):
-        print ("Testing dsp to % conversion -72 to +12")
-
-        print("Testing dsp 0 == -infinity dB")
-        db = self.converter.from_rcn(0)
-
-        self.assertAlmostEqual(db, -math.inf, 2)
-
-        print("Testing dsp 65535 == +12 dB")
-        db = self.converter.from_rcn(65535)
+    # (dsp value, dB) pairs for the default -72 to +12 dB range.
+    FROM_RCN_CASES = [(0, -math.inf), (1, -72.0), (65535, +12.0)]
+    TO_RCN_CASES = [(-math.inf, 0), (-71.9977, 1), (+12.0, 65535)]
 
-        self.assertAlmostEqual(db, +12.0, 2)
+    def test_from_rcn(self):
+        print("Testing dsp to dB conversion -72 to +12")
 
-        print("Testing dsp 1 == -72 dB")
-        db = self.converter.from_rcn(1)
+        for val, db in self.FROM_RCN_CASES:
+            with self.subTest(val=val):
+                self.assertAlmostEqual(self.converter.from_rcn(val), db, 2)
 
-        self.assertAlmostEqual(db, -72.0, 2)
-    
     def test_to_rcn(self):
         print("Testing dB to dsp conversion -72 to +12")
 
-        print("Testing -infinity dB == dsp 0")
-        val = self.converter.to_rcn(-math.inf)
-
-        self.assertEqual(val, 0)
-
-        print("Testing +12 dB == dsp 65535")
-        val = self.converter.to_rcn(+12.0)
+        for db, val in self.TO_RCN_CASES:
+            with self.subTest(db=db):
+                self.assertEqual(self.converter.to_rcn(db), val)
 
-        self.assertEqual(val, 65535)
+    def test_from_rcn_block(self):
+        print("Testing block dsp to dB conversion")
 
-        min_db = -71.9977
+        vals = {101: 0, 102: 1, 103: 65535}
+        dbs = self.converter.from_rcn_block(vals)
 
-        print(f"Testing {min_db} dB == dsp 1")
+        self.assertEqual(list(dbs), [101, 102, 103])
 
-        val = self.converter.to_rcn(min_db)
+        for rcn, val in vals.items():
+            self.assertAlmostEqual(dbs[rcn], self.converter.from_rcn(val), 6)
 
-        self.assertEqual(val, 1)
 
 if __name__ == "__main__":
     unittest.main()
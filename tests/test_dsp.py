@@ -0,0 +1,141 @@
+import asyncio
+import unittest
+import unittest.mock
+
+from pysymnet import DSP
+from pysymnet.connection import SymNetConnection
+
+
+class TestAddControls(unittest.IsolatedAsyncioTestCase):
+    async def test_failed_subscribe(self):
+        async def do_task(conn, msg, *args, **kwargs):
+            if msg.startswith(b"PUE"):
+                raise TimeoutError()
+
+            return 0
+
+        dsp = DSP("localhost")
+        conn = dsp.connection
+
+        with unittest.mock.patch.object(SymNetConnection, "_do_task", do_task):
+            print("Testing a failed batch leaves no subscriptions behind")
+
+            with self.assertRaises(TimeoutError):
+                await dsp.add_controls([("a", 10, None), ("b", 11, None)])
+
+            self.assertEqual(conn._subscriptions, {})
+            self.assertEqual(conn._pending_subs, set())
+            self.assertEqual(dsp._controls, {})
+
+            print("Testing a failed control leaves no subscriptions behind")
+
+            with self.assertRaises(TimeoutError):
+                await dsp.add_control("c", 12)
+
+            self.assertEqual(conn._subscriptions, {})
+            self.assertEqual(conn._pending_subs, set())
+            self.assertEqual(dsp._controls, {})
+
+    async def test_missing_value(self):
+        params = {10: 5, 20: -1}
+
+        async def do_task(conn, msg, *args, **kwargs):
+            if msg.startswith(b"GS "):
+                return params[int(msg[3:])]
+
+            return 0
+
+        dsp = DSP("localhost")
+
+        with unittest.mock.patch.object(SymNetConnection, "_do_task", do_task):
+            print("Testing a missing value is None for single controls")
+
+            await dsp.add_control("a", 10)
+            await dsp.add_control("b", 20)
+
+            self.assertEqual(dsp.a, 5)
+            self.assertIsNone(dsp.b)
+
+            print("Testing a missing value is None for batches")
+
+            params[10] = -1
+
+            await dsp.refresh_all()
+
+            self.assertIsNone(dsp.a)
+
+            await dsp.add_controls([("c", 20, None)])
+
+            self.assertIsNone(dsp.c)
+
+
+class TestControls(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.sent = []
+
+        async def do_task(conn, msg, *args, **kwargs):
+            self.sent.append(msg)
+
+            return 5
+
+        patcher = unittest.mock.patch.object(
+            SymNetConnection, "_do_task", do_task
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.dsp = DSP("localhost")
+
+    async def test_shared_init(self):
+        print("Testing concurrent inits share one subscription")
+
+        control = await self.dsp.add_control("a", 10)
+
+        await control.destroy()
+
+        self.sent.clear()
+
+        await asyncio.gather(control.async_init(), control.async_init())
+
+        self.assertEqual(self.sent.count(b"PUE 10"), 1)
+        self.assertEqual(self.sent.count(b"GS 10"), 1)
+
+    async def test_coalesced_writes(self):
+        control = await self.dsp.add_control("a", 10)
+
+        self.sent.clear()
+
+        print("Testing quick assignments send only the last value")
+
+        control.value = 1
+        control.value = 2
+        self.dsp.a = 3
+
+        await asyncio.sleep(0.05)
+
+        self.assertEqual(self.sent, [b"CSQ 10 3"])
+
+        print("Testing an unchanged value is not sent")
+
+        self.sent.clear()
+
+        control.value = 3
+        await control.set_value(3)
+
+        await asyncio.sleep(0.05)
+
+        self.assertEqual(self.sent, [])
+
+    async def test_attributes(self):
+        await self.dsp.add_control("a", 10)
+
+        print("Testing control values are read as attributes")
+
+        self.assertEqual(self.dsp.a, 5)
+
+        with self.assertRaises(AttributeError):
+            self.dsp.b
+
+
+if __name__ == "__main__":
+    unittest.main()
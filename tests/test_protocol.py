@@ -0,0 +1,73 @@
+import unittest
+import unittest.mock
+
+from pysymnet.protocol import SymNetProtocol
+from pysymnet.tasks import SymNetBasicTask
+
+
+class TestProtocolFraming(unittest.TestCase):
+    def test_data_received(self):
+        updates = []
+
+        protocol = SymNetProtocol(False, None, None)
+        protocol.update_callback = lambda rcn, val: updates.append((rcn, val))
+
+        print("Testing a line split across reads is joined")
+
+        protocol.data_received(b"#1=10\r#2=")
+        protocol.data_received(b"20\r")
+
+        self.assertEqual(updates, [(1, 10), (2, 20)])
+
+        print("Testing a line split across several reads is joined")
+
+        for chunk in (b"#", b"12", b"=", b"34", b"5\r"):
+            protocol.data_received(chunk)
+
+        self.assertEqual(updates[-1], (12, 345))
+
+        print("Testing CRLF line endings are accepted")
+
+        protocol.data_received(b"#3=30\r\n")
+
+        self.assertEqual(updates[-1], (3, 30))
+
+        print("Testing malformed updates are not published")
+
+        protocol.data_received(b"#4=\r#x=1\r")
+
+        self.assertEqual(updates[-1], (3, 30))
+
+
+class TestProtocolQueue(unittest.IsolatedAsyncioTestCase):
+    async def test_requeued_cancelled_task(self):
+        transport = unittest.mock.Mock()
+
+        protocol = SymNetProtocol(False, None, None)
+        protocol.connection_made(transport)
+
+        print("Testing a task cancelled before a reconnect isn't sent")
+
+        stale = SymNetBasicTask()
+        stale.cancel()
+
+        # As re-queued by the connection after reconnecting.
+        protocol.queue_task(b"CS 1 2\r", stale)
+
+        transport.write.assert_not_called()
+
+        print("Testing the retried command is sent and completed")
+
+        fresh = SymNetBasicTask()
+
+        protocol.queue_task_retry(b"CS 1 2\r", fresh)
+
+        transport.write.assert_called_once_with(b"CS 1 2\r")
+
+        protocol.data_received(b"ACK\r")
+
+        self.assertTrue(fresh.result())
+
+
+if __name__ == "__main__":
+    unittest.main()